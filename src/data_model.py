@@ -6,7 +6,10 @@ This is based on the `CF standard terminology
 """
 import abc
 import dataclasses as dc
+import functools
 import itertools
+import numbers
+import types
 import typing
 from src import util
 import src.units  # fully qualify name to reduce confusion with "units" attributes
@@ -156,8 +159,14 @@ class AbstractDMCoordinateBounds(AbstractDMDependentVariable):
 
 _AXIS_NAMES = ('X', 'Y', 'Z', 'T')
 _ALL_AXIS_NAMES = _AXIS_NAMES + ('BOUNDS', 'OTHER')
+_AXIS_NAMES_SET = frozenset(_AXIS_NAMES) # for membership tests
 
-@util.mdtf_dataclass
+# Coordinate classes are declared with slots=True, since one instance is created
+# per coordinate of every variable in every file we parse: this drops the
+# per-instance __dict__. DMBoundsDimension is never modified after creation, so
+# it's also frozen (and hence hashable).
+
+@util.mdtf_dataclass(frozen=True, slots=True)
 class DMBoundsDimension(object):
     """Placeholder object to represent the bounds dimension of a
     :class:`DMCoordinateBounds` object. Not a dimension coordinate, and strictly
@@ -186,7 +195,16 @@ class DMBoundsDimension(object):
         """
         return False
 
-@util.mdtf_dataclass
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def from_name(cls, name):
+        """Return an instance with name *name*. Since instances are immutable,
+        all bounds variables using the same name for their bounds dimension
+        share one object.
+        """
+        return cls(name=name)
+
+@util.mdtf_dataclass(slots=True)
 class _DMCoordinateShared(object):
     """Fields common to all :class:`AbstractDMCoordinate` child classes which
     aren't fixed to particular values.
@@ -197,8 +215,10 @@ class _DMCoordinateShared(object):
     standard_name: str = util.MANDATORY
     units: src.units.Units = util.MANDATORY
     axis: str = 'OTHER'
-    bounds_var: AbstractDMCoordinateBounds = None
-    value: typing.Union[int, float] = None
+    # Don't include bounds_var in testing for equality: it's derived from the
+    # coordinate, and its dims contain a reference back to this object.
+    bounds_var: AbstractDMCoordinateBounds = dc.field(default=None, compare=False)
+    value: numbers.Real = None
 
     @property
     def bounds(self):
@@ -232,7 +252,7 @@ class _DMCoordinateShared(object):
         """
         return dc.replace(self, value=new_value)
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMCoordinate(_DMCoordinateShared):
     """Class to describe a single coordinate variable (dimension coordinate or
     scalar coordinate, in the sense used by the `CF conventions
@@ -249,7 +269,7 @@ class DMCoordinate(_DMCoordinateShared):
     axis: str = 'OTHER'
     """Coordinate axis identifier ('X', 'Y', etc.)"""
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMLongitudeCoordinate(_DMCoordinateShared):
     """Class to describe a longitude dimension coordinate.
     """
@@ -264,7 +284,7 @@ class DMLongitudeCoordinate(_DMCoordinateShared):
     axis: str = 'X'
     """Coordinate axis identifier. Always 'X' for this coordinate."""
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMLatitudeCoordinate(_DMCoordinateShared):
     """Class to describe a latitude dimension coordinate.
     """
@@ -279,7 +299,7 @@ class DMLatitudeCoordinate(_DMCoordinateShared):
     axis: str = 'Y'
     """Coordinate axis identifier. Always 'Y' for this coordinate."""
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMVerticalCoordinate(_DMCoordinateShared):
     """Class to describe a non-parametric vertical coordinate (height or depth),
     following the `CF conventions <http://cfconventions.org/Data/cf-conventions/cf-conventions-1.8/cf-conventions.html#vertical-coordinate>`__.
@@ -296,7 +316,7 @@ class DMVerticalCoordinate(_DMCoordinateShared):
     """Coordinate axis identifier. Always 'Z' for this coordinate."""
     positive: str = util.MANDATORY
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMParametricVerticalCoordinate(DMVerticalCoordinate):
     """Class to describe `parametric vertical coordinates
     <http://cfconventions.org/Data/cf-conventions/cf-conventions-1.8/cf-conventions.html#parametric-vertical-coordinate>`__.
@@ -312,7 +332,7 @@ class DMParametricVerticalCoordinate(DMVerticalCoordinate):
     # model.
     formula_terms: str = dc.field(default=None, compare=False)
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMGenericTimeCoordinate(_DMCoordinateShared):
     """Applies to collections of variables, which may be at different time
     frequencies (or other attributes).
@@ -333,12 +353,16 @@ class DMGenericTimeCoordinate(_DMCoordinateShared):
 
     @property
     def is_static(self):
-        """Check for time-independent data ('fx' in CMIP6 DRS.) Do the comparison
-        by checking date_range against the placeholder value because that's
+        """Check for time-independent data ('fx' in CMIP6 DRS.) Do the check
+        on date_range rather than frequency, because the range placeholder is
         unique -- we may be using a different DateFrequency depending on the
-        data source.
+        data source. Ask the range object instead of comparing it to
+        :data:`~src.util.datelabel.FXDateRange`, since DateRange equality
+        testing is comparatively expensive. As with that comparison, a range
+        that isn't a DateRange (e.g. None, before one has been assigned) counts
+        as static.
         """
-        return (self.range == util.FXDateRange)
+        return getattr(self.range, 'is_static', True)
 
     @classmethod
     def from_instances(cls, *t_coords):
@@ -347,13 +371,19 @@ class DMGenericTimeCoordinate(_DMCoordinateShared):
         """
         if not t_coords:
             raise ValueError()
-        t_coords = [util.coerce_to_dataclass(t, cls) for t in t_coords]
+        # shallow copy of fields: util.coerce_to_dataclass() on an instance
+        # would run dc.asdict(), which recurses from bounds_var back to t
+        t_coords = [
+            util.coerce_to_dataclass(
+                {f.name: getattr(t, f.name) for f in dc.fields(t)}, cls
+            ) for t in t_coords
+        ]
         t0 = t_coords.pop(0)
         if any(t != t0 for t in t_coords):
             raise ValueError("mismatch")
         return t0
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMTimeCoordinate(DMGenericTimeCoordinate):
     name: str = util.MANDATORY
     """Coordinate name."""
@@ -378,14 +408,13 @@ class DMTimeCoordinate(DMGenericTimeCoordinate):
 
 # Use the "register" method, instead of inheritance, to associate these classes
 # with their corresponding abstract interfaces, because Python dataclass fields
-# aren't recognized as implementing an abc.abstractmethod.
+# aren't recognized as implementing an abc.abstractmethod. Registration applies
+# to child classes too (eg DMTimeCoordinate), so only register the base classes.
 AbstractDMCoordinate.register(DMCoordinate)
 AbstractDMCoordinate.register(DMLongitudeCoordinate)
 AbstractDMCoordinate.register(DMLatitudeCoordinate)
 AbstractDMCoordinate.register(DMVerticalCoordinate)
-AbstractDMCoordinate.register(DMParametricVerticalCoordinate)
 AbstractDMCoordinate.register(DMGenericTimeCoordinate)
-AbstractDMCoordinate.register(DMTimeCoordinate)
 AbstractDMCoordinate.register(DMBoundsDimension)
 
 def coordinate_from_struct(d, class_dict=None, **kwargs):
@@ -427,9 +456,9 @@ class _DMPlaceholderCoordinateBase(object):
     replaced by the appropriate translated coordinates when that object is used
     to create a :class:`~src.core.TranslatedVarlistEntry` object.
     """
-    pass
+    __slots__ = () # so that child classes don't get a __dict__
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMPlaceholderCoordinate(_DMCoordinateShared, _DMPlaceholderCoordinateBase):
     """Dummy base class for placeholder coordinates. Placeholder coordinates are
     only used in instantiating :class:`~src.core.FieldlistEntry` objects: they're
@@ -446,7 +475,7 @@ class DMPlaceholderCoordinate(_DMCoordinateShared, _DMPlaceholderCoordinateBase)
     axis: str = 'OTHER'
     """Coordinate axis identifier ('X', 'Y', etc.)"""
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMPlaceholderXCoordinate(_DMCoordinateShared, _DMPlaceholderCoordinateBase):
     """Dummy base class for placeholder X axis coordinates. Placeholder coordinates are
     only used in instantiating :class:`~src.core.FieldlistEntry` objects: they're
@@ -463,7 +492,7 @@ class DMPlaceholderXCoordinate(_DMCoordinateShared, _DMPlaceholderCoordinateBase
     axis: str = 'X'
     """Coordinate axis identifier ('X', 'Y', etc.)"""
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMPlaceholderYCoordinate(_DMCoordinateShared, _DMPlaceholderCoordinateBase):
     """Dummy base class for placeholder Y axis coordinates. Placeholder coordinates are
     only used in instantiating :class:`~src.core.FieldlistEntry` objects: they're
@@ -480,7 +509,7 @@ class DMPlaceholderYCoordinate(_DMCoordinateShared, _DMPlaceholderCoordinateBase
     axis: str = 'Y'
     """Coordinate axis identifier ('X', 'Y', etc.)"""
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMPlaceholderZCoordinate(_DMCoordinateShared, _DMPlaceholderCoordinateBase):
     """Dummy base class for placeholder Z axis coordinates. Placeholder coordinates are
     only used in instantiating :class:`~src.core.FieldlistEntry` objects: they're
@@ -498,7 +527,7 @@ class DMPlaceholderZCoordinate(_DMCoordinateShared, _DMPlaceholderCoordinateBase
     """Coordinate axis identifier ('X', 'Y', etc.)"""
     positive: str = NotImplemented
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class DMPlaceholderTCoordinate(_DMCoordinateShared, _DMPlaceholderCoordinateBase):
     """Dummy base class for placeholder T axis coordinates. Placeholder coordinates are
     only used in instantiating :class:`~src.core.FieldlistEntry` objects: they're
@@ -521,12 +550,16 @@ class DMPlaceholderTCoordinate(_DMCoordinateShared, _DMPlaceholderCoordinateBase
 
     @property
     def is_static(self):
-        """Check for time-independent data ('fx' in CMIP6 DRS.) Do the comparison
-        by checking date_range against the placeholder value because that's
+        """Check for time-independent data ('fx' in CMIP6 DRS.) Do the check
+        on date_range rather than frequency, because the range placeholder is
         unique -- we may be using a different DateFrequency depending on the
-        data source.
+        data source. Ask the range object instead of comparing it to
+        :data:`~src.util.datelabel.FXDateRange`, since DateRange equality
+        testing is comparatively expensive. As with that comparison, a range
+        that isn't a DateRange (e.g. None, before one has been assigned) counts
+        as static.
         """
-        return (self.range == util.FXDateRange)
+        return getattr(self.range, 'is_static', True)
 
 
 # ------------------------------------------------------------------------------
@@ -553,40 +586,49 @@ class _DMDimensionsMixin(object):
                 self.scalar_coords.append(c)
             else:
                 self.dims.append(c)
+        self._init_axes()
+
+    def _init_axes(self):
+        """Validate the coordinates' axes and cache the dicts returned by
+        :meth:`build_axes`, since the X, Y, Z, T properties look them up on
+        every access. dims are only changed by :meth:`change_coord`, which calls
+        ``__post_init__`` again.
+        """
         # raises exceptions if axes are inconsistent
-        _ = self.build_axes(self.dims, verify=True)
+        self._dim_axes = self.build_axes(self.dims)
 
     @property
     def dim_axes(self):
         """Retrun dict mapping axes labels ('X', 'Y', etc.) to corresponding
-        dimension coordinate objects.
+        dimension coordinate objects. This is a read-only view of the dict
+        cached by :meth:`_init_axes`.
         """
-        return self.build_axes(self.dims, verify=False)
+        return types.MappingProxyType(self._dim_axes)
 
     @property
     def X(self):
         """Return X axis dimension coordinate if defined, else None."""
-        return self.dim_axes.get('X', None)
+        return self._dim_axes.get('X', None)
 
     @property
     def Y(self):
         """Return Y axis dimension coordinate if defined, else None."""
-        return self.dim_axes.get('Y', None)
+        return self._dim_axes.get('Y', None)
 
     @property
     def Z(self):
         """Return Z axis dimension coordinate if defined, else None."""
-        return self.dim_axes.get('Z', None)
+        return self._dim_axes.get('Z', None)
 
     @property
     def T(self):
         """Return T axis dimension coordinate if defined, else None."""
-        return self.dim_axes.get('T', None)
+        return self._dim_axes.get('T', None)
 
     @property
     def dim_axes_set(self):
         """Return frozenset of dimension coordinate axes labels."""
-        return frozenset(self.dim_axes.keys())
+        return frozenset(self._dim_axes.keys())
 
     @property
     def is_static(self):
@@ -602,27 +644,31 @@ class _DMDimensionsMixin(object):
                 return c
         return None
 
-    def build_axes(self, *coords, verify=True):
+    def build_axes(self, *coords):
         """Constructs a dict mapping axes labels to
         dimension coordinates (of type :class:`AbstractDMCoordinate`.)
+
+        Raises:
+            ValueError: If more than one coordinate in *coords* has the same
+                axis (other than 'OTHER').
         """
-        if verify:
-            # validate that we don't have duplicate axes
-            d = util.WormDict()
-            verify_d = util.WormDict()
-            for c in itertools.chain(*coords):
-                if c.axis != 'OTHER' and c.axis in verify_d:
-                    err_name = getattr(self, 'name', self.__class__.__name__)
-                    raise ValueError((f"Duplicate definition of {c.axis} axis in "
-                        f"{err_name}: {c}, {verify_d[c.axis]}"))
-                verify_d[c.axis] = c
-                if c.axis in _AXIS_NAMES:
-                    d[c.axis] = c
-            return d
-        else:
-            # assume we've already verified, so use a quicker version of same logic
-            return {c.axis: c for c in itertools.chain(*coords) \
-                if c.axis in _AXIS_NAMES}
+        # validate that we don't have duplicate axes. Look up each coordinate's
+        # axis once, and use plain dicts since we do our own check for overwrites.
+        d = dict()
+        verify_d = dict()
+        for c in itertools.chain(*coords):
+            ax = c.axis
+            if ax == 'OTHER':
+                # any number of coordinates may have an unidentified axis
+                continue
+            if ax in verify_d:
+                err_name = getattr(self, 'name', self.__class__.__name__)
+                raise ValueError((f"Duplicate definition of {ax} axis in "
+                    f"{err_name}: {c}, {verify_d[ax]}"))
+            verify_d[ax] = c
+            if ax in _AXIS_NAMES_SET:
+                d[ax] = c
+        return d
 
     def change_coord(self, ax_name, new_class=None, **kwargs):
         """Replace attributes on a given coordinate, but also optionally cast
@@ -648,11 +694,14 @@ class _DMDimensionsMixin(object):
             # keep all classes
             new_coord = dc.replace(old_coord, **kwargs)
         else:
+            # shallow copy: dc.asdict() would recursively copy bounds_var, whose
+            # dims in turn reference old_coord
+            new_kwargs = {f.name: getattr(old_coord, f.name) \
+                for f in dc.fields(old_coord)}
             if new_coord_class is None:
                 new_coord_class = old_coord.__class__
-                new_kwargs = dc.asdict(old_coord)
             else:
-                new_kwargs = util.filter_dataclass(old_coord, new_coord_class)
+                new_kwargs = util.filter_dataclass(new_kwargs, new_coord_class)
             new_kwargs.update(kwargs)
             if isinstance(new_class, dict):
                 for k, cls_ in new_class.items():
@@ -681,14 +730,21 @@ class DMDependentVariable(_DMDimensionsMixin):
         """Call :meth:`build_axes` and deal with CF modifier, if any.
         """
         super(DMDependentVariable, self).__post_init__(coords)
-        # raises exceptions if axes are inconsistent
-        _ = self.build_axes(self.dims, self.scalar_coords, verify=True)
         # if specified, verify that POD modifier attributes are valid
         if not self.modifier.lower().strip() in (None, ''):
             _str = src.core.VariableTranslator()
             if self.modifier not in _str.modifier:
                 raise ValueError(f"Modifier {self.modifier} is not a recognized value.")
 
+    def _init_axes(self):
+        """Validate dimension and scalar coordinate axes together in a single
+        call to :meth:`build_axes`, rather than validating the dimensions on
+        their own first, and cache the results.
+        """
+        # raises exceptions if axes are inconsistent
+        self._axes = self.build_axes(self.dims, self.scalar_coords)
+        self._dim_axes = {ax: c for ax, c in self._axes.items() if not c.is_scalar}
+
     @property
     def full_name(self):
         """Object's full name, to be used in logging and debugging. Preferred
@@ -718,8 +774,9 @@ class DMDependentVariable(_DMDimensionsMixin):
     def axes(self):
         """Superset of the :meth:`dim_axes` dict (whose values contain coordinate
         dimensions only) that includes axes corresponding to scalar coordinates.
+        This is a read-only view of the dict cached by :meth:`_init_axes`.
         """
-        return self.build_axes(self.dims, self.scalar_coords, verify=False)
+        return types.MappingProxyType(self._axes)
 
     @property
     def axes_set(self):
@@ -727,7 +784,7 @@ class DMDependentVariable(_DMDimensionsMixin):
         corresponding to coordinate dimensions only) that includes axes labels
         corresponding to scalar coordinates.
         """
-        return frozenset(self.axes.keys())
+        return frozenset(self._axes.keys())
 
     def add_scalar(self, ax, ax_value, **kwargs):
         """Metadata operation corresponding to taking a slice of a higher-dimensional
@@ -741,7 +798,7 @@ class DMDependentVariable(_DMDimensionsMixin):
         new_dims = self.dims.copy()
         new_dims.remove(dim)
         new_scalars = self.scalar_coords.copy()
-        new_scalars.add(new_dim)
+        new_scalars.append(new_dim)
         return dc.replace(
             self,
             coords=(new_dims + new_scalars),
@@ -786,8 +843,8 @@ class DMCoordinateBounds(DMAuxiliaryCoordinate):
         if self.scalar_coords:
             raise ValueError(("Attempted to create DMCoordinateBounds "
                 f"{self.name} with scalar coordinates: {self.scalar_coords}."))
-        if len(self.dims) != 2 or \
-            'BOUNDS' not in {c.axis for c in self.dims}:
+        if len(self.dims) != 2 or not \
+            (self.dims[0].axis == 'BOUNDS' or self.dims[1].axis == 'BOUNDS'):
             raise ValueError(("Attempted to create DMCoordinateBounds "
                 f"{self.name} with improper dimensions: {self.dims}."))
 
@@ -795,10 +852,8 @@ class DMCoordinateBounds(DMAuxiliaryCoordinate):
     def coord(self):
         """CF dimension coordinate for which this is the bounds.
         """
-        for c in self.dims:
-            if c.axis != 'BOUNDS':
-                return c
-        raise ValueError()
+        # dims validated to have length 2 in __post_init__
+        return self.dims[0] if self.dims[1].axis == 'BOUNDS' else self.dims[1]
 
     @classmethod
     def from_coordinate(cls, coord, bounds_dim):
@@ -807,7 +862,7 @@ class DMCoordinateBounds(DMAuxiliaryCoordinate):
         kwargs = {attr: getattr(coord, attr) for attr \
             in ('name', 'standard_name', 'units')}
         if not isinstance(bounds_dim, DMBoundsDimension):
-            bounds_dim = DMBoundsDimension(name=bounds_dim)
+            bounds_dim = DMBoundsDimension.from_name(bounds_dim)
         kwargs['coords'] = [coord, bounds_dim]
         coord_bounds = cls(**kwargs)
         coord.bounds_var = coord_bounds
@@ -827,10 +882,9 @@ class DMVariable(DMDependentVariable):
 
 # Use the "register" method, instead of inheritance, to associate these classes
 # with their corresponding abstract interfaces, because Python dataclass fields
-# aren't recognized as implementing an abc.abstractmethod.
+# aren't recognized as implementing an abc.abstractmethod. DMAuxiliaryCoordinate
+# and DMVariable are covered by registering their parent class.
 AbstractDMDependentVariable.register(DMDependentVariable)
-AbstractDMDependentVariable.register(DMAuxiliaryCoordinate)
-AbstractDMDependentVariable.register(DMVariable)
 AbstractDMCoordinateBounds.register(DMCoordinateBounds)
 
 @util.mdtf_dataclass
@@ -0,0 +1,200 @@
+import unittest
+import src.core # import before data_model to avoid circular import
+from src import util
+from src import data_model as dm
+
+
+class TestDMCoordinateSlots(unittest.TestCase):
+    def test_no_dict(self):
+        coords = [
+            dm.DMCoordinate(name='foo', standard_name='foo', units='1'),
+            dm.DMLongitudeCoordinate(),
+            dm.DMLatitudeCoordinate(),
+            dm.DMVerticalCoordinate(name='lev', standard_name='air_pressure',
+                units='hPa', positive='down'),
+            dm.DMTimeCoordinate(name='time', units='days'),
+            dm.DMPlaceholderTCoordinate(),
+            dm.DMBoundsDimension(name='bnds')
+        ]
+        for c in coords:
+            self.assertFalse(hasattr(c, '__dict__'), c.__class__.__name__)
+
+    def test_varlist_no_dict(self):
+        from src import varlist_util
+        coords = [
+            varlist_util.VarlistCoordinate(name='foo', standard_name='foo',
+                units='1', axis='OTHER'),
+            varlist_util.VarlistLongitudeCoordinate(),
+            varlist_util.VarlistLatitudeCoordinate(),
+            varlist_util.VarlistVerticalCoordinate(name='lev',
+                standard_name='air_pressure', units='hPa', positive='down'),
+            varlist_util.VarlistPlaceholderTimeCoordinate(frequency='day'),
+            varlist_util.VarlistTimeCoordinate(name='time', units='days',
+                frequency='day')
+        ]
+        for c in coords:
+            self.assertFalse(hasattr(c, '__dict__'), c.__class__.__name__)
+            self.assertFalse(c.need_bounds)
+            c.need_bounds = True
+            self.assertTrue(c.need_bounds)
+        self.assertEqual(coords[-1].frequency, util.DateFrequency('day'))
+
+    def test_no_inherited_slots(self):
+        self.assertEqual(dm.DMTimeCoordinate.__slots__, ('frequency', ))
+        self.assertEqual(dm.DMLongitudeCoordinate.__slots__, ('name', ))
+
+class TestDMTimeCoordinateIsStatic(unittest.TestCase):
+    def test_is_static(self):
+        for cls_ in (dm.DMGenericTimeCoordinate, dm.DMPlaceholderTCoordinate):
+            self.assertTrue(cls_(range=None).is_static, cls_.__name__)
+            self.assertTrue(cls_(range=util.FXDateRange).is_static, cls_.__name__)
+            self.assertFalse(
+                cls_(range=util.DateRange('1990-2010')).is_static, cls_.__name__
+            )
+
+class TestDMDimensionsAxes(unittest.TestCase):
+    def test_multiple_other_axes(self):
+        foo = dm.DMCoordinate(name='foo', standard_name='foo', units='1')
+        bar = dm.DMCoordinate(name='bar', standard_name='bar', units='1')
+        lat = dm.DMLatitudeCoordinate()
+        var = dm.DMVariable(name='var', standard_name='var', coords=[foo, bar, lat])
+        self.assertEqual(var.dims, [foo, bar, lat])
+        self.assertEqual(var.dim_axes, {'Y': lat})
+
+    def test_axes_read_only(self):
+        lev = dm.DMVerticalCoordinate(name='lev', standard_name='air_pressure',
+            units='hPa', positive='down')
+        lat = dm.DMLatitudeCoordinate()
+        var = dm.DMVariable(name='var', standard_name='var', coords=[lat])
+        with self.assertRaises(TypeError):
+            var.dim_axes['Z'] = lev
+        with self.assertRaises(TypeError):
+            var.axes['Z'] = lev
+        self.assertIsNone(var.Z)
+        self.assertEqual(var.axes_set, frozenset(['Y']))
+
+    def test_duplicate_axes(self):
+        coords_d = {
+            'X': (dm.DMLongitudeCoordinate(), dm.DMLongitudeCoordinate(name='lon2')),
+            'Y': (dm.DMLatitudeCoordinate(), dm.DMLatitudeCoordinate(name='lat2')),
+            'Z': (
+                dm.DMVerticalCoordinate(name='lev', standard_name='air_pressure',
+                    units='hPa', positive='down'),
+                dm.DMVerticalCoordinate(name='lev2', standard_name='air_pressure',
+                    units='hPa', positive='down')
+            ),
+            'T': (
+                dm.DMTimeCoordinate(name='time', units='days'),
+                dm.DMTimeCoordinate(name='time2', units='days')
+            ),
+            'BOUNDS': (
+                dm.DMBoundsDimension(name='bnds'), dm.DMBoundsDimension(name='nv')
+            )
+        }
+        for ax, coords in coords_d.items():
+            with self.assertRaises(ValueError, msg=ax):
+                _ = dm.DMVariable(name='var', standard_name='var', coords=coords)
+        # also for scalar coordinates
+        lev = coords_d['Z'][0]
+        with self.assertRaises(ValueError):
+            _ = dm.DMVariable(name='var', standard_name='var',
+                coords=[lev, lev.make_scalar(500)])
+
+class TestDMDimensionsChangeCoord(unittest.TestCase):
+    def setUp(self):
+        self.lat = dm.DMLatitudeCoordinate()
+        self.lon = dm.DMLongitudeCoordinate()
+        self.lat_bnds = dm.DMCoordinateBounds.from_coordinate(self.lat, 'bnds')
+        self.var = dm.DMVariable(name='var', standard_name='var',
+            coords=[self.lat, self.lon])
+
+    def test_change_class_with_bounds(self):
+        self.var.change_coord('Y', new_class=dm.DMCoordinate)
+        new_lat = self.var.Y
+        self.assertIsInstance(new_lat, dm.DMCoordinate)
+        self.assertEqual(new_lat.name, 'lat')
+        self.assertEqual(new_lat.axis, 'Y')
+        self.assertIs(new_lat.bounds_var, self.lat_bnds)
+        self.assertIs(self.var.dims[0], new_lat)
+
+    def test_change_attr(self):
+        self.var.change_coord('Y', name='latitude')
+        new_lat = self.var.Y
+        self.assertIsNot(new_lat, self.lat)
+        self.assertEqual(new_lat.name, 'latitude')
+        self.assertEqual(self.lat.name, 'lat')
+        self.assertIs(self.var.dims[0], new_lat)
+
+    def test_change_missing_coord(self):
+        # static variable; no T axis to change
+        with self.assertRaises(TypeError):
+            self.var.change_coord('T')
+
+class TestDMCoordinateEquality(unittest.TestCase):
+    @staticmethod
+    def make_var(name):
+        # each variable gets its own (equal) coordinate and bounds objects
+        lat = dm.DMLatitudeCoordinate()
+        time = dm.DMTimeCoordinate(name='time', units='days')
+        _ = dm.DMCoordinateBounds.from_coordinate(lat, 'bnds')
+        _ = dm.DMCoordinateBounds.from_coordinate(time, 'bnds')
+        return dm.DMVariable(name=name, standard_name=name, coords=[time, lat])
+
+    def test_bounded_coord_eq(self):
+        var1 = self.make_var('var1')
+        var2 = self.make_var('var2')
+        self.assertIsNot(var1.Y, var2.Y)
+        self.assertIsNot(var1.Y.bounds_var, var2.Y.bounds_var)
+        self.assertEqual(var1.Y, var2.Y)
+        self.assertEqual(var1.T, var2.T)
+        self.assertNotEqual(var1.Y, dm.DMLatitudeCoordinate(name='lat2'))
+
+    def test_generic_time_from_instances(self):
+        var1 = self.make_var('var1')
+        var2 = self.make_var('var2')
+        t = dm.DMGenericTimeCoordinate.from_instances(var1.T, var2.T)
+        self.assertIsInstance(t, dm.DMGenericTimeCoordinate)
+        self.assertEqual(t.name, 'time')
+        with self.assertRaises(ValueError):
+            _ = dm.DMGenericTimeCoordinate.from_instances(
+                var1.T, dm.DMTimeCoordinate(name='time2', units='days')
+            )
+
+    def test_dataset_dedup(self):
+        var1 = self.make_var('var1')
+        var2 = self.make_var('var2')
+        ds = dm.DMDataSet(contents=[var1, var2])
+        self.assertEqual(ds.vars, [var1, var2])
+        self.assertEqual(len(ds.dims), 2)
+        self.assertEqual(ds.Y, var1.Y)
+        self.assertIsInstance(ds.T, dm.DMGenericTimeCoordinate)
+
+class TestDMDependentVariableScalars(unittest.TestCase):
+    def test_add_remove_scalar(self):
+        lev = dm.DMVerticalCoordinate(name='lev', standard_name='air_pressure',
+            units='hPa', positive='down')
+        lat = dm.DMLatitudeCoordinate()
+        lon = dm.DMLongitudeCoordinate()
+        var = dm.DMVariable(name='var', standard_name='var', coords=[lev, lat, lon])
+
+        var_500 = var.add_scalar('Z', 500)
+        self.assertEqual(var_500.dims, [lat, lon])
+        self.assertEqual(var_500.dim_axes, {'Y': lat, 'X': lon})
+        self.assertEqual(var_500.scalar_coords, [lev.make_scalar(500)])
+        self.assertEqual(var_500.axes['Z'].value, 500)
+        self.assertEqual(set(var_500.axes.keys()), {'X', 'Y', 'Z'})
+        self.assertIsNone(var_500.Z)
+        self.assertEqual(var_500.get_scalar('Z').value, 500)
+        # original unchanged
+        self.assertEqual(var.dims, [lev, lat, lon])
+        self.assertEqual(var.scalar_coords, [])
+
+        var_2 = var_500.remove_scalar('Z', position=0)
+        self.assertEqual(var_2.dims, [lev, lat, lon])
+        self.assertEqual(var_2.dim_axes, {'Z': lev, 'Y': lat, 'X': lon})
+        self.assertEqual(var_2.axes, var_2.dim_axes)
+        self.assertEqual(var_2.scalar_coords, [])
+        self.assertIsNone(var_2.get_scalar('Z'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ import dataclasses
 import enum
 import functools
 import re
+import types
 import typing
 from . import basic
 from . import exceptions
@@ -506,6 +507,61 @@ def _mdtf_dataclass_type_check(self, log):
                 f"Expected {f.name} to be {f.type}, got {type(value)} "
                 f"({repr(value)})."))
 
+def _mdtf_dataclass_getstate(self):
+    """``__getstate__`` for frozen dataclasses with slots, which can't be
+    unpickled by the default ``__setstate__``.
+    """
+    return [getattr(self, f.name) for f in dataclasses.fields(self)]
+
+def _mdtf_dataclass_setstate(self, state):
+    """``__setstate__`` for frozen dataclasses with slots; see
+    :func:`_mdtf_dataclass_getstate`.
+    """
+    for f, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+def _mdtf_dataclass_inherits_slot(cls, name):
+    """Return True if attribute *name* of dataclass *cls* resolves to a slot
+    declared by one of its parent classes, rather than to a class attribute (e.g.
+    a field default on a non-slotted mixin) that shadows it in the MRO.
+    """
+    for base in cls.__mro__[1:]:
+        if name in base.__dict__:
+            return isinstance(base.__dict__[name], types.MemberDescriptorType)
+    return False
+
+def _mdtf_dataclass_add_slots(cls, is_frozen):
+    """Implementation of ``slots=True`` for :func:`mdtf_dataclass`: return a
+    copy of dataclass *cls* with ``__slots__`` set to the names of its fields,
+    excluding those already declared as slots by a parent class. Python 3.10
+    redeclares every inherited field as a new slot, which makes instances of
+    child classes larger instead of smaller, and Python 3.11+ omits a slot for
+    an inherited field if a mixin earlier in the MRO shadows the parent's slot
+    descriptor with a default value, which makes the field read-only.
+    """
+    if '__slots__' in cls.__dict__:
+        raise TypeError(f'{cls.__name__} already specifies __slots__')
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict['__slots__'] = tuple(
+        f for f in field_names if not _mdtf_dataclass_inherits_slot(cls, f)
+    )
+    for f in field_names:
+        # remove class attributes holding field defaults, which would shadow
+        # the slot descriptors; defaults are kept by the generated __init__
+        cls_dict.pop(f, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)  # belongs to the old class
+
+    qualname = getattr(cls, '__qualname__', None)
+    cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        cls.__qualname__ = qualname
+    if is_frozen:
+        type.__setattr__(cls, '__getstate__', _mdtf_dataclass_getstate)
+        type.__setattr__(cls, '__setstate__', _mdtf_dataclass_setstate)
+    return cls
+
 DEFAULT_MDTF_DATACLASS_KWARGS = {'init': True, 'repr': True, 'eq': True,
     'order': False, 'unsafe_hash': False, 'frozen': False}
 
@@ -549,7 +605,10 @@ def mdtf_dataclass(cls=None, **deco_kwargs):
     Args:
         cls (class): Class to be decorated.
         deco_kwargs: Optional. Keyword arguments to pass to the Python
-            :py:func:`~dataclasses.dataclass` class decorator.
+            :py:func:`~dataclasses.dataclass` class decorator. In particular,
+            ``slots=True`` can be used for lightweight classes with many instances;
+            on all supported Pythons, each class only declares slots for the
+            fields it adds to its parent classes.
 
     Raises:
         :class:`~exceptions.DataclassParseError`: If we attempted to construct an
@@ -570,7 +629,11 @@ def mdtf_dataclass(cls=None, **deco_kwargs):
         type.__setattr__(cls, '__post_init__', _dummy_post_init)
 
     # apply dataclasses' decorator
-    cls = dataclasses.dataclass(cls, **dc_kwargs)
+    if dc_kwargs.pop('slots', False):
+        cls = dataclasses.dataclass(cls, **dc_kwargs)
+        cls = _mdtf_dataclass_add_slots(cls, dc_kwargs['frozen'])
+    else:
+        cls = dataclasses.dataclass(cls, **dc_kwargs)
 
     # Do type coercion after dataclass' __init__, but before user __post_init__
     # Do type check after __init__ and __post_init__
@@ -1,4 +1,5 @@
 import unittest
+import copy
 import unittest.mock as mock
 import dataclasses
 import typing
@@ -191,6 +192,66 @@ class TestMDTFDataclass(unittest.TestCase):
         with self.assertRaises(dataclasses.FrozenInstanceError):
             dummy.b = 7
 
+    def test_decorator_slots(self):
+        @util.mdtf_dataclass(frozen=True, slots=True)
+        class Dummy(object):
+            a: str = util.MANDATORY
+            b: int = None
+
+        dummy = Dummy(a="foo", b="5")
+        self.assertFalse(hasattr(dummy, '__dict__'))
+        self.assertEqual(dummy.a, "foo")
+        self.assertEqual(dummy.b, 5)
+        self.assertEqual(hash(dummy), hash(Dummy(a="foo", b=5)))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            dummy.b = 7
+        with self.assertRaises(exceptions.DataclassParseError):
+            _ = Dummy(b=5)
+        self.assertEqual(copy.deepcopy(dummy), dummy)
+
+    def test_slots_inheritance(self):
+        @util.mdtf_dataclass(slots=True)
+        class Dummy1(object):
+            a: str = util.MANDATORY
+            b: int = None
+
+        @util.mdtf_dataclass(slots=True)
+        class Dummy2(Dummy1):
+            b: int = 5
+            c: list = dataclasses.field(default_factory=list)
+
+        # don't redeclare slots for inherited fields (done by python < 3.11)
+        self.assertEqual(Dummy2.__slots__, ('c',))
+        dummy = Dummy2(a="foo", c=(1, 2))
+        self.assertFalse(hasattr(dummy, '__dict__'))
+        self.assertEqual(dummy.a, "foo")
+        self.assertEqual(dummy.b, 5)
+        self.assertEqual(dummy.c, [1, 2])
+        dummy.b = 7
+        self.assertEqual(dummy.b, 7)
+
+    def test_slots_shadowed_by_mixin(self):
+        @util.mdtf_dataclass(slots=True)
+        class Dummy1(object):
+            a: str = util.MANDATORY
+            b: int = None
+
+        @util.mdtf_dataclass
+        class DummyMixin(object):
+            __slots__ = ()
+            b: int = 5
+
+        @util.mdtf_dataclass(slots=True)
+        class Dummy2(DummyMixin, Dummy1):
+            c: str = ""
+
+        # mixin's default for b shadows Dummy1's slot, so redeclare it
+        self.assertEqual(Dummy2.__slots__, ('b', 'c'))
+        dummy = Dummy2(a="foo")
+        self.assertFalse(hasattr(dummy, '__dict__'))
+        self.assertEqual(dummy.b, 5)
+        dummy.b = 7
+        self.assertEqual(dummy.b, 7)
     def test_mandatory_args(self):
         @util.mdtf_dataclass
         class Dummy(object):
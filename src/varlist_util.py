@@ -28,6 +28,11 @@ class _VarlistGlobalSettings(object):
 
 @util.mdtf_dataclass
 class _VarlistTimeSettings(object):
+    # Only used as a field specification (for filter_dataclass and as a base
+    # class), never instantiated on its own; empty slots so that
+    # VarlistTimeCoordinate can be slotted.
+    __slots__ = ()
+
     frequency:     util.DateFrequency = \
         dc.field(default=util.NOTSET, metadata={'query': True})
     min_frequency: util.DateFrequency = \
@@ -58,42 +63,44 @@ class VarlistCoordinateMixin(object):
     used by one or more variables. Corresponds to list entries in the
     "dimensions" section of the POD's settings.jsonc file.
     """
+    __slots__ = () # fields are slotted by the child coordinate classes
+
     need_bounds: bool = False
 
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class VarlistCoordinate(data_model.DMCoordinate, VarlistCoordinateMixin):
     # name: str              # fields from data_model.DMCoordinate
     # standard_name: str
     # units: units.Units
     # axis: str
     # bounds: AbstractDMCoordinateBounds
-    # value: typing.Union[int, float] # for scalar coordinates only
+    # value: numbers.Real    # for scalar coordinates only
     # need_bounds: bool      # fields from VarlistCoordinateMixin
     # name_in_model: str
     # bounds_in_model: str
     pass
 
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class VarlistLongitudeCoordinate(data_model.DMLongitudeCoordinate,
                                  VarlistCoordinateMixin):
     range: tuple = None
 
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class VarlistLatitudeCoordinate(data_model.DMLatitudeCoordinate,
                                 VarlistCoordinateMixin):
     range: tuple = None
 
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class VarlistVerticalCoordinate(data_model.DMVerticalCoordinate,
                                 VarlistCoordinateMixin):
     pass
 
 
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class VarlistPlaceholderTimeCoordinate(data_model.DMGenericTimeCoordinate,
                                        VarlistCoordinateMixin):
     frequency: typing.Any = ""
@@ -101,12 +108,10 @@ class VarlistPlaceholderTimeCoordinate(data_model.DMGenericTimeCoordinate,
     max_frequency: typing.Any = ""
     min_duration: typing.Any = 'any'
     max_duration: typing.Any = 'any'
+    # standard_name = 'time' and axis = 'T' inherited from DMGenericTimeCoordinate
 
-    standard_name = 'time'
-    axis = 'T'
 
-
-@util.mdtf_dataclass
+@util.mdtf_dataclass(slots=True)
 class VarlistTimeCoordinate(_VarlistTimeSettings, data_model.DMTimeCoordinate,
                             VarlistCoordinateMixin, ABC):
     pass